@@ -1,36 +1,136 @@
-import sys, os, json, shutil, stat, getpass, hashlib, subprocess, ctypes
+import sys, os, re, json, mmap, shutil, stat, time, contextlib, functools, getpass, hashlib
 from PyQt6 import QtWidgets, QtGui, QtCore
 
+# Prefer orjson for parsing and serializing the (potentially large) JSON file, then ujson, then the stdlib.
+try:
+    import orjson
+
+    def json_loads(raw):
+        if isinstance(raw, mmap.mmap):
+            # orjson reads the mapping through the buffer protocol without copying it
+            with memoryview(raw) as view:
+                return orjson.loads(view)
+        return orjson.loads(raw)
+
+    def json_dumps(data):
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+except ImportError:
+    try:
+        import ujson
+
+        def json_loads(raw):
+            if isinstance(raw, mmap.mmap):
+                raw = raw[:]
+            return ujson.loads(raw)
+
+        def json_dumps(data):
+            return ujson.dumps(data, indent=4, escape_forward_slashes=False).encode("utf-8")
+    except ImportError:
+        def json_loads(raw):
+            if isinstance(raw, mmap.mmap):
+                raw = raw[:]
+            return json.loads(raw)
+
+        def json_dumps(data):
+            return json.dumps(data, indent=4).encode("utf-8")
+
 # Mapping of full DLSS override key names to short labels for display.
-KEY_MAPPING = {
+# Both sides are interned so the summary sets hold shared string objects.
+KEY_MAPPING = {sys.intern(key): sys.intern(label) for key, label in {
     "Disable_FG_Override": "FG",
     "Disable_RR_Override": "RR",
     "Disable_SR_Override": "SR",
     "Disable_RR_Model_Override": "RR-M",
     "Disable_SR_Model_Override": "SR-M",
-}
+}.items()}
+
+# Default location of the NVIDIA app's ApplicationStorage.json for the current user.
+DEFAULT_JSON_PATH = fr"C:\Users\{getpass.getuser()}\AppData\Local\NVIDIA Corporation\NVIDIA app\NvBackend\ApplicationStorage.json"
+
+# Override keys as a set, for a single intersection per dict during the JSON walk.
+_KEYS = frozenset(KEY_MAPPING)
+
+# Matches any override key set to true in the raw file bytes, used to cheaply rule out files with nothing to change.
+_OVERRIDE_TRUE_RE = re.compile(rb'"(?:' + b"|".join(re.escape(key.encode()) for key in KEY_MAPPING) + rb')"\s*:\s*true')
+
+# Files at least this large are memory-mapped instead of read into a bytes object.
+_MMAP_THRESHOLD = 4 * 1024 * 1024
+
+# Cache of file hashes: path -> (st_mtime_ns, st_size, hexdigest).
+_HASH_CACHE = {}
+
+# Returns os.stat(path), or None if the file does not exist or cannot be accessed.
+def stat_or_none(path):
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
 
 # Computes the SHA-256 hash of a file's contents.
-def compute_file_hash(path):
+# The result is cached until the file's modification time or size changes.
+# st may be passed when the caller already has a fresh os.stat result for path.
+def compute_file_hash(path, st=None):
     h = hashlib.sha256()
     try:
+        if st is None:
+            st = os.stat(path)
+        cached = _HASH_CACHE.get(path)
+        if cached and cached[:2] == (st.st_mtime_ns, st.st_size):
+            return cached[2]
         with open(path, "rb") as f:
-            # Read file in chunks of 8192 bytes
-            for chunk in iter(lambda: f.read(8192), b""):
-                h.update(chunk)
+            # Python 3.11+ streams the whole file through the hash in C
+            if hasattr(hashlib, "file_digest"):
+                digest = hashlib.file_digest(f, "sha256").hexdigest()
+            else:
+                # Older Pythons: read file in chunks of 1 MiB
+                for chunk in iter(lambda: f.read(1 << 20), b""):
+                    h.update(chunk)
+                digest = h.hexdigest()
+        _HASH_CACHE[path] = (st.st_mtime_ns, st.st_size, digest)
+        return digest
     except Exception as e:
         print(f"Error computing hash: {e}")
     return h.hexdigest()
 
+# Opens the file and yields its contents as a buffer: a read-only memory map for large files,
+# plain bytes otherwise. The buffer is only valid inside the with block.
+@contextlib.contextmanager
+def read_file_buffer(path):
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size < _MMAP_THRESHOLD:
+            yield f.read()
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if hasattr(mmap, "MADV_SEQUENTIAL"):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            yield mm
+
+# Records an already-known hash for the file's current state in the hash cache.
+def cache_file_hash(path, digest):
+    try:
+        st = os.stat(path)
+    except OSError:
+        _HASH_CACHE.pop(path, None)
+        return
+    _HASH_CACHE[path] = (st.st_mtime_ns, st.st_size, digest)
+
 # Creates a backup copy of the given file and writes its hash metadata to a JSON file.
-def create_backup(main_path, backup_path, meta_path, log_func):
+# precomputed_hash may be passed when the caller has already hashed the file's current contents.
+def create_backup(main_path, backup_path, meta_path, log_func, precomputed_hash=None):
     try:
-        shutil.copy2(main_path, backup_path)  # Copy the file with metadata preservation
-        original_hash = compute_file_hash(main_path)
+        if os.path.lexists(backup_path):
+            os.remove(backup_path)
+        # A hard link costs no copy; the link is broken when modify_file atomically replaces the file.
+        try:
+            os.link(main_path, backup_path)
+        except OSError:
+            shutil.copyfile(main_path, backup_path)
+        original_hash = precomputed_hash or compute_file_hash(main_path)
         # Create metadata with both original and modified hash set to original hash
-        meta = {"original_hash": original_hash, "modified_hash": original_hash}
-        with open(meta_path, "w", encoding="utf-8") as f:
-            json.dump(meta, f)
+        meta = {"original_hash": original_hash}
+        set_modified_state(meta, main_path, original_hash)
+        with open(meta_path, "wb") as f:
+            f.write(json.dumps(meta).encode("utf-8"))
         log_func(f"No backup found, creating new backup.\nBackup created at: {backup_path}")
         return meta
     except Exception as e:
@@ -40,8 +140,8 @@ def create_backup(main_path, backup_path, meta_path, log_func):
 # Loads backup metadata from the specified meta file.
 def load_backup_meta(meta_path):
     try:
-        with open(meta_path, "r", encoding="utf-8") as f:
-            meta = json.load(f)
+        with open(meta_path, "rb") as f:
+            meta = json.loads(f.read())
         return meta
     except Exception:
         return None
@@ -49,116 +149,206 @@ def load_backup_meta(meta_path):
 # Saves the provided metadata to the specified meta file.
 def save_backup_meta(meta_path, meta):
     try:
-        with open(meta_path, "w", encoding="utf-8") as f:
-            json.dump(meta, f)
+        with open(meta_path, "wb") as f:
+            f.write(json.dumps(meta).encode("utf-8"))
     except Exception as e:
         print(f"Error saving backup meta: {e}")
 
+# Returns the backup file and backup meta file paths that belong to main_path.
+def backup_paths(main_path):
+    return main_path + ".backup", main_path + ".backup.meta"
+
+# Records digest, plus the file's current modification time and size, as the state we last left the file in.
+def set_modified_state(meta, path, digest):
+    meta["modified_hash"] = digest
+    st = stat_or_none(path)
+    if st is None:
+        meta.pop("modified_mtime_ns", None)
+        meta.pop("modified_size", None)
+    else:
+        meta["modified_mtime_ns"] = st.st_mtime_ns
+        meta["modified_size"] = st.st_size
+
+# Returns True if the file is still in the state recorded in meta. A precomputed hash is always compared
+# directly. Otherwise an unchanged modification time and size is trusted as is; the file is only hashed
+# when they differ or are missing from older metas.
+def matches_modified_state(path, meta, st=None, precomputed_hash=None):
+    if precomputed_hash is not None:
+        return precomputed_hash == meta["modified_hash"]
+    if st is None:
+        st = stat_or_none(path)
+    if st is not None and meta.get("modified_mtime_ns") == st.st_mtime_ns and meta.get("modified_size") == st.st_size:
+        return True
+    return compute_file_hash(path, st) == meta["modified_hash"]
+
 # Checks if the existing backup is obsolete (i.e. the file has been modified externally).
 # If so, it creates a new backup.
-def update_backup_if_obsolete(main_path, backup_path, meta_path, log_func):
-    if not os.path.exists(backup_path) or not os.path.exists(meta_path):
-        return create_backup(main_path, backup_path, meta_path, log_func)
+def update_backup_if_obsolete(main_path, backup_path, meta_path, log_func, precomputed_hash=None):
+    if stat_or_none(backup_path) is None or stat_or_none(meta_path) is None:
+        return create_backup(main_path, backup_path, meta_path, log_func, precomputed_hash)
     meta = load_backup_meta(meta_path)
     if meta is None:
         log_func("Backup meta is invalid, creating new backup.")
-        return create_backup(main_path, backup_path, meta_path, log_func)
-    current_hash = compute_file_hash(main_path)
-    if current_hash != meta["modified_hash"]:
+        return create_backup(main_path, backup_path, meta_path, log_func, precomputed_hash)
+    if not matches_modified_state(main_path, meta, precomputed_hash=precomputed_hash):
         log_func("External update detected. Updating backup to current file as new baseline.")
-        return create_backup(main_path, backup_path, meta_path, log_func)
+        return create_backup(main_path, backup_path, meta_path, log_func, precomputed_hash)
     return meta
 
-# Recursively traverses the JSON object, flipping any DLSS override keys set to True to False.
+# Traverses the JSON object, flipping any DLSS override keys set to True to False.
 # It also logs which keys (abbreviated) were changed, storing them in the updates dictionary.
-def recursive_process(obj, keys_to_update, updates):
-    modified = False
-    if isinstance(obj, dict):
-        for key in keys_to_update:
-            if key in obj and obj[key] is True:
-                obj[key] = False  # Flip the key value to False
-                modified = True
-                identifier = obj.get("LocalId") or obj.get("DisplayName") or "Unknown"
-                updates.setdefault(identifier, set()).add(KEY_MAPPING.get(key, key))
-        if "Application" in obj and isinstance(obj["Application"], dict):
-            for key in keys_to_update:
-                if key in obj["Application"] and obj["Application"][key] is True:
-                    obj["Application"][key] = False
-                    modified = True
-                    identifier = obj["Application"].get("DisplayName") or obj.get("LocalId") or "Unknown"
-                    updates.setdefault(identifier, set()).add(KEY_MAPPING.get(key, key))
-        for value in obj.values():
-            if isinstance(value, (dict, list)):
-                if recursive_process(value, keys_to_update, updates):
-                    modified = True
-    elif isinstance(obj, list):
-        for item in obj:
-            if isinstance(item, (dict, list)):
-                if recursive_process(item, keys_to_update, updates):
-                    modified = True
-    return modified
+# Returns the number of keys flipped.
+# Keys in an "Application" dict are attributed to its DisplayName first; other dicts use their own
+# LocalId/DisplayName, and dicts without either fall back to the nearest enclosing identifier.
+# Uses an explicit stack instead of recursion so deeply nested files cannot hit the recursion limit.
+def recursive_process(obj, updates):
+    flipped = 0
+    key_mapping = KEY_MAPPING
+    stack = [(obj, None, None)] if type(obj) in (dict, list) else []
+    while stack:
+        cur, parent_identifier, name = stack.pop()
+        if type(cur) is dict:
+            if name == "Application":
+                identifier = cur.get("DisplayName") or parent_identifier
+            else:
+                identifier = cur.get("LocalId") or cur.get("DisplayName") or parent_identifier
+            matches = _KEYS.intersection(cur)
+            if matches:
+                # Look up this node's change set once, however many of its keys flip.
+                changes = None
+                for key in matches:
+                    if cur[key] is True:
+                        cur[key] = False  # Flip the key value to False
+                        flipped += 1
+                        if changes is None:
+                            changes = updates.setdefault(identifier or "Unknown", set())
+                        changes.add(key_mapping[key])
+            # Push in reverse so children are visited in document order; the key is kept to spot "Application".
+            stack.extend((child, identifier, name) for name, child in reversed(cur.items()) if type(child) in (dict, list))
+        else:
+            stack.extend((child, parent_identifier, None) for child in reversed(cur) if type(child) in (dict, list))
+    return flipped
+
+# Writes data to a temporary file next to path, flushes it to disk and then atomically
+# replaces path with it, so a crash mid-write never leaves a truncated file behind.
+# If readonly is set, the temp file is created read-only, so no separate chmod is needed.
+def write_file_atomic(path, data, readonly=False):
+    # A uniquely named temp file in the same directory, so os.replace stays on one volume
+    # and a stale temp file from an earlier crash can never be picked up.
+    tmp_path = os.path.join(os.path.dirname(path), f".{os.path.basename(path)}.{os.urandom(6).hex()}.tmp")
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+    # The mode only applies once the file exists; the descriptor opened here stays writable.
+    fd = os.open(tmp_path, flags, 0o444 if readonly else 0o666)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except Exception:
+        try:
+            # Windows refuses to delete a read-only file, so clear the bit first.
+            os.chmod(tmp_path, stat.S_IWRITE)
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
 
 # Reads the JSON file, processes it to update DLSS keys, writes changes back, and updates metadata.
-def modify_file(main_path, log_func):
-    backup_path = main_path + ".backup"
-    meta_path = main_path + ".backup.meta"
-    meta = update_backup_if_obsolete(main_path, backup_path, meta_path, log_func)
+# If readonly is set, the file is made read-only after a successful modification.
+def modify_file(main_path, log_func, readonly=False):
+    backup_path, meta_path = backup_paths(main_path)
     try:
-        with open(main_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        # Read the file once: the same buffer is hashed for the backup check and then parsed.
+        with read_file_buffer(main_path) as raw:
+            current_hash = hashlib.sha256(raw).hexdigest()
+            # Skip parsing entirely when no override key is set to true.
+            data = json_loads(raw) if _OVERRIDE_TRUE_RE.search(raw) else None
     except Exception as e:
         log_func(f"Error reading JSON: {e}")
         return False, None
-    keys_to_update = list(KEY_MAPPING.keys())
+    cache_file_hash(main_path, current_hash)
+    meta = update_backup_if_obsolete(main_path, backup_path, meta_path, log_func, current_hash)
+    if data is None:
+        log_func("No modifications were made. Either keys were not found or already set to False.")
+        return False, meta
     updates = {}
-    modified = recursive_process(data, keys_to_update, updates)
-    if modified:
-        try:
-            with open(main_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=4)
-            log_func("File has been updated.")
-            mod_hash = compute_file_hash(main_path)
-            meta["modified_hash"] = mod_hash
-            save_backup_meta(meta_path, meta)
-        except Exception as e:
-            log_func(f"Error writing JSON: {e}")
-            return False, None
-    else:
+    if not recursive_process(data, updates):
+        # Nothing flipped: skip serializing, writing, hashing and the meta update.
         log_func("No modifications were made. Either keys were not found or already set to False.")
-    # Log a summary of changes per application.
-    for app, changes in updates.items():
-        summary = ", ".join(f"{abbr} ✓" for abbr in sorted(changes))
-        log_func(f"{app}: {summary}")
-    if modified:
-        log_func("Reboot recommended for changes to take effect.")
-    return modified, meta
+        return False, meta
+    try:
+        out = json_dumps(data)
+        write_file_atomic(main_path, out, readonly)
+        log_func("File has been updated.")
+        # Hash the bytes we just wrote instead of reading the file back.
+        mod_hash = hashlib.sha256(out).hexdigest()
+        cache_file_hash(main_path, mod_hash)
+        set_modified_state(meta, main_path, mod_hash)
+        save_backup_meta(meta_path, meta)
+    except Exception as e:
+        log_func(f"Error writing JSON: {e}")
+        return False, None
+    # Log a summary of changes per application, as a single message.
+    log_func("\n".join(f"{app}: " + ", ".join(f"{abbr} ✓" for abbr in sorted(changes)) for app, changes in updates.items()))
+    log_func("Reboot recommended for changes to take effect.")
+    if readonly:
+        log_func("File set to read-only.")
+    return True, meta
 
 # Reverts the file to its backup version if it hasn't been modified externally.
 def revert_file(main_path, log_func):
-    backup_path = main_path + ".backup"
-    meta_path = main_path + ".backup.meta"
-    if not os.path.exists(backup_path) or not os.path.exists(meta_path):
+    backup_path, meta_path = backup_paths(main_path)
+    # Stat each file once; the results are reused for hashing and the hard link check below.
+    backup_st = stat_or_none(backup_path)
+    if backup_st is None or stat_or_none(meta_path) is None:
         log_func("No backup available to revert.")
         return False
     meta = load_backup_meta(meta_path)
-    current_hash = compute_file_hash(main_path)
-    if current_hash != meta["modified_hash"]:
+    main_st = stat_or_none(main_path)
+    if not matches_modified_state(main_path, meta, main_st):
         log_func("Cannot revert: file has been externally modified since our last update.")
         return False
     try:
-        os.chmod(main_path, stat.S_IWRITE)
-        shutil.copy2(backup_path, main_path)
+        # The backup may still be a hard link to the untouched file, in which case there is nothing to copy.
+        if main_st is None or not os.path.samestat(backup_st, main_st):
+            os.chmod(main_path, stat.S_IWRITE)
+            shutil.copy2(backup_path, main_path)
+            # copy2 carries over the backup's mtime, so replace any cached hash for the file explicitly.
+            cache_file_hash(main_path, meta["original_hash"])
         log_func("Reverted to backup.")
-        meta["modified_hash"] = meta["original_hash"]
+        set_modified_state(meta, main_path, meta["original_hash"])
         save_backup_meta(meta_path, meta)
         return True
     except Exception as e:
         log_func(f"Error during revert: {e}")
         return False
 
+# Runs modify_file on each path in one pass; returns True if any file was modified.
+def modify_files(paths, log_func, readonly=False):
+    modified = False
+    for path in paths:
+        if len(paths) > 1:
+            log_func(f"--- {path} ---")
+        if modify_file(path, log_func, readonly)[0]:
+            modified = True
+    return modified
+
+# Runs revert_file on each path in one pass; returns True only if every file was reverted.
+def revert_files(paths, log_func):
+    reverted = True
+    for path in paths:
+        if len(paths) > 1:
+            log_func(f"--- {path} ---")
+        if not revert_file(path, log_func):
+            reverted = False
+    return reverted
+
 # Attempts to restart NVIDIA services. Runs the command with elevated rights if needed.
 # The command is run hidden and its output is captured and logged.
 def restart_services(log_func):
+    # Imported here: these are only needed when the user asks to restart services.
+    import subprocess, ctypes
     cmd = '/c net stop "NvContainerLocalSystem" && net start "NvContainerLocalSystem" && net stop "NVDisplay.ContainerLocalSystem" && net start "NVDisplay.ContainerLocalSystem"'
     # Check if user is admin
     if ctypes.windll.shell32.IsUserAnAdmin():
@@ -176,6 +366,73 @@ def restart_services(log_func):
         else:
             log_func("Restart services command launched. Windows should prompt for admin rights.")
 
+# Dark theme with blue accents. Applied once to the QApplication, so every window and dialog shares it.
+DARK_THEME_STYLESHEET = """
+QWidget {
+    background-color: #1e1e1e;
+    color: #e0e0e0;
+    font-family: "Segoe UI", sans-serif;
+}
+QLineEdit, QPlainTextEdit {
+    background-color: #2d2d30;
+    border: 1px solid #3e3e42;
+    padding: 5px;
+    border-radius: 3px;
+    color: #e0e0e0;
+}
+QPushButton {
+    background-color: #007ACC;
+    border: none;
+    padding: 6px 12px;
+    border-radius: 4px;
+    color: #ffffff;
+    font-weight: bold;
+}
+QPushButton:hover {
+    background-color: #005A9E;
+}
+QPushButton:pressed {
+    background-color: #003F73;
+}
+QCheckBox {
+    spacing: 5px;
+}
+QCheckBox::indicator {
+    width: 16px;
+    height: 16px;
+}
+QCheckBox::indicator:unchecked {
+    border: 1px solid #555555;
+    background-color: #2d2d30;
+}
+QCheckBox::indicator:checked {
+    border: 1px solid #007ACC;
+    background-color: #007ACC;
+}
+"""
+
+# Signals emitted by a Worker. Connected slots on GUI objects are invoked on the GUI thread through Qt's queued connections.
+class WorkerSignals(QtCore.QObject):
+    log = QtCore.pyqtSignal(str)
+    finished = QtCore.pyqtSignal(object)
+
+# Runs a file operation, func(paths, log_func), on a QThreadPool thread so the UI stays responsive.
+# Log lines and the operation's return value are sent back through the signals.
+class Worker(QtCore.QRunnable):
+    def __init__(self, func, paths):
+        super().__init__()
+        self.func = func
+        self.paths = paths
+        self.signals = WorkerSignals()
+
+    def run(self):
+        try:
+            result = self.func(self.paths, self.signals.log.emit)
+        except Exception as e:
+            self.signals.log.emit(f"Unexpected error: {e}")
+            result = None
+        self.signals.finished.emit(result)
+
 # Custom dialog that presents the user with three options: Restart Services, Reboot, or Do Nothing.
 class CloseActionDialog(QtWidgets.QDialog):
     def __init__(self, parent=None):
@@ -206,8 +463,12 @@ class DLSSOverrideApp(QtWidgets.QMainWindow):
         self.setWindowTitle("DLSS Override Editor")
         self.resize(800, 400)
         self.session_processed = False  # Tracks if any changes were made in the current session.
+        self.worker = None  # Keeps the running Worker (and its signals) alive until it finishes.
+        self.pending_log = []  # Log messages waiting to be appended to the log display in one go.
+        self.stat_cache = None  # (path, time, os.stat result or None) from the last stat_path call.
+        self.file_paths = []  # Paths from the path line edit, kept in sync by path_changed.
+        self.browsed_paths = None  # Files picked together in the browse dialog, shown joined by os.pathsep.
         self.setup_ui()
-        self.apply_dark_theme()
 
     # Set up UI elements: file path input, buttons, and log display.
     def setup_ui(self):
@@ -216,9 +477,9 @@ class DLSSOverrideApp(QtWidgets.QMainWindow):
         layout = QtWidgets.QVBoxLayout(central)
         path_layout = QtWidgets.QHBoxLayout()
         self.path_edit = QtWidgets.QLineEdit()
-        username = getpass.getuser()
-        default_path = fr"C:\Users\{username}\AppData\Local\NVIDIA Corporation\NVIDIA app\NvBackend\ApplicationStorage.json"
-        self.path_edit.setText(default_path)
+        # Keep the parsed paths in file_paths so handlers don't re-read and re-parse the line edit.
+        self.path_edit.textChanged.connect(self.path_changed)
+        self.path_edit.setText(DEFAULT_JSON_PATH)
         path_layout.addWidget(self.path_edit)
         self.browse_button = QtWidgets.QPushButton("Browse")
         self.browse_button.clicked.connect(self.browse_file)
@@ -235,126 +496,148 @@ class DLSSOverrideApp(QtWidgets.QMainWindow):
         self.revert_button.clicked.connect(self.revert_file)
         btn_layout.addWidget(self.revert_button)
         layout.addLayout(btn_layout)
-        self.log_text = QtWidgets.QTextEdit()
+        self.log_text = QtWidgets.QPlainTextEdit()
         self.log_text.setReadOnly(True)
+        self.log_text.setMaximumBlockCount(10000)  # Drop the oldest lines instead of growing without bound.
         layout.addWidget(self.log_text)
 
-    # Applies a dark theme with blue accents.
-    def apply_dark_theme(self):
-        style = """
-        QWidget {
-            background-color: #1e1e1e;
-            color: #e0e0e0;
-            font-family: "Segoe UI", sans-serif;
-        }
-        QLineEdit, QTextEdit {
-            background-color: #2d2d30;
-            border: 1px solid #3e3e42;
-            padding: 5px;
-            border-radius: 3px;
-            color: #e0e0e0;
-        }
-        QPushButton {
-            background-color: #007ACC;
-            border: none;
-            padding: 6px 12px;
-            border-radius: 4px;
-            color: #ffffff;
-            font-weight: bold;
-        }
-        QPushButton:hover {
-            background-color: #005A9E;
-        }
-        QPushButton:pressed {
-            background-color: #003F73;
-        }
-        QCheckBox {
-            spacing: 5px;
-        }
-        QCheckBox::indicator {
-            width: 16px;
-            height: 16px;
-        }
-        QCheckBox::indicator:unchecked {
-            border: 1px solid #555555;
-            background-color: #2d2d30;
-        }
-        QCheckBox::indicator:checked {
-            border: 1px solid #007ACC;
-            background-color: #007ACC;
-        }
-        """
-        self.setStyleSheet(style)
-
-    # Appends a message to the log display.
+    # Stores the paths whenever the path line edit changes. Typed text is always a single path, since
+    # os.pathsep is legal in Windows file names; only a multi-file selection from the browse dialog yields several.
+    def path_changed(self, text):
+        if self.browsed_paths and text == os.pathsep.join(self.browsed_paths):
+            self.file_paths = list(self.browsed_paths)
+        else:
+            self.browsed_paths = None
+            self.file_paths = [text.strip()] if text.strip() else []
+
+    # Returns True if every selected path exists; otherwise shows an error listing the missing ones.
+    def check_selected_files(self):
+        missing = [path for path in self.file_paths if self.stat_path(path) is None]
+        if not self.file_paths or missing:
+            QtWidgets.QMessageBox.critical(self, "Error", "File not found:\n" + "\n".join(missing))
+            return False
+        return True
+
+    # Describes the selected files for the confirmation dialogs.
+    def describe_selected_files(self):
+        noun = "this file" if len(self.file_paths) == 1 else "these files"
+        return noun + "?\n" + "\n".join(self.file_paths)
+
+    # Queues a message for the log display. Messages logged in the same event loop iteration
+    # are appended together by flush_log, so the document is laid out once per batch.
     def log(self, message):
-        self.log_text.append(message)
+        if not self.pending_log:
+            QtCore.QTimer.singleShot(0, self.flush_log)
+        self.pending_log.append(message)
+
+    # Appends all queued messages to the log display.
+    def flush_log(self):
+        if self.pending_log:
+            self.log_text.appendPlainText("\n".join(self.pending_log))
+            self.pending_log.clear()
+
+    # Returns os.stat(path), or None if it does not exist, reusing the last result for the same path
+    # for up to half a second. Only the GUI-side existence and browse checks use this; the workers
+    # always stat the files themselves, after the user has confirmed.
+    def stat_path(self, path):
+        now = time.monotonic()
+        if self.stat_cache and self.stat_cache[0] == path and now - self.stat_cache[1] < 0.5:
+            return self.stat_cache[2]
+        st = stat_or_none(path)
+        self.stat_cache = (path, now, st)
+        return st
+
+    # Enables or disables the Process/Revert buttons while a worker is running.
+    def set_busy(self, busy):
+        self.process_button.setEnabled(not busy)
+        self.revert_button.setEnabled(not busy)
+
+    # Runs func(paths, log_func) on the global thread pool and calls on_finished with its result on the GUI thread.
+    def start_worker(self, func, paths, on_finished):
+        self.set_busy(True)
+        self.stat_cache = None  # The worker is about to change the files, so later existence checks must stat again.
+        self.worker = Worker(func, paths)
+        self.worker.signals.log.connect(self.log)
+        self.worker.signals.finished.connect(on_finished)
+        QtCore.QThreadPool.globalInstance().start(self.worker)
 
-    # Opens a file dialog for the user to select the JSON file.
+    # Opens a file dialog for the user to select one or more JSON files.
     def browse_file(self):
-        current_path = self.path_edit.text().strip()
-        initial_dir = os.path.dirname(current_path) if os.path.exists(current_path) else ""
-        file_path, _ = QtWidgets.QFileDialog.getOpenFileName(self, "Select ApplicationStorage.json file", initial_dir, "JSON Files (*.json);;All Files (*)")
-        if file_path:
-            self.path_edit.setText(file_path)
+        current_path = self.file_paths[0] if self.file_paths else ""
+        initial_dir = os.path.dirname(current_path) if self.stat_path(current_path) is not None else ""
+        file_paths, _ = QtWidgets.QFileDialog.getOpenFileNames(self, "Select ApplicationStorage.json file", initial_dir, "JSON Files (*.json);;All Files (*)")
+        if file_paths:
+            self.browsed_paths = file_paths if len(file_paths) > 1 else None
+            self.path_edit.setText(os.pathsep.join(file_paths))
 
-    # Processes the file by calling modify_file and sets the session flag.
+    # Processes the selected files by running modify_files on a worker thread.
     def process_file(self):
-        file_path = self.path_edit.text().strip()
-        if not os.path.exists(file_path):
-            QtWidgets.QMessageBox.critical(self, "Error", f"File not found:\n{file_path}")
+        if not self.check_selected_files():
             return
-        reply = QtWidgets.QMessageBox.question(self, "Confirm", f"Are you sure you want to modify this file?\n{file_path}",
+        reply = QtWidgets.QMessageBox.question(self, "Confirm", f"Are you sure you want to modify {self.describe_selected_files()}",
                                                  QtWidgets.QMessageBox.StandardButton.Yes | QtWidgets.QMessageBox.StandardButton.No)
         if reply != QtWidgets.QMessageBox.StandardButton.Yes:
             self.log("Operation cancelled by user.")
             return
-        modified, _ = modify_file(file_path, self.log)
+        # Files are made read-only as they are written, on the worker.
+        self.start_worker(functools.partial(modify_files, readonly=self.readonly_checkbox.isChecked()), list(self.file_paths), self.process_finished)
+
+    # Called when modify_files has finished; sets the session flag.
+    def process_finished(self, modified):
+        self.worker = None
+        self.stat_cache = None
+        self.set_busy(False)
         if modified:
             self.session_processed = True
-        if modified and self.readonly_checkbox.isChecked():
-            try:
-                os.chmod(file_path, stat.S_IREAD)
-                self.log("File set to read-only.")
-            except Exception as e:
-                self.log(f"Error setting file to read-only: {e}")
-
-    # Reverts the file to its backup state and updates the session flag.
+        self.flush_log()
+
+    # Reverts the selected files to their backup state by running revert_files on a worker thread.
     def revert_file(self):
-        file_path = self.path_edit.text().strip()
-        if not os.path.exists(file_path):
-            QtWidgets.QMessageBox.critical(self, "Error", f"File not found:\n{file_path}")
+        if not self.check_selected_files():
             return
-        reply = QtWidgets.QMessageBox.question(self, "Confirm Revert", f"Are you sure you want to revert changes to this file?\n{file_path}",
+        reply = QtWidgets.QMessageBox.question(self, "Confirm Revert", f"Are you sure you want to revert changes to {self.describe_selected_files()}",
                                                  QtWidgets.QMessageBox.StandardButton.Yes | QtWidgets.QMessageBox.StandardButton.No)
         if reply != QtWidgets.QMessageBox.StandardButton.Yes:
             self.log("Revert cancelled by user.")
             return
-        if revert_file(file_path, self.log):
+        # revert_files stats each file itself on the worker, after the user has confirmed.
+        self.start_worker(revert_files, list(self.file_paths), self.revert_finished)
+
+    # Called when revert_files has finished; a successful revert leaves no pending changes for this session.
+    def revert_finished(self, reverted):
+        self.worker = None
+        self.stat_cache = None
+        self.set_busy(False)
+        if reverted:
             self.log("Revert successful.")
-            if self.session_processed:
-                self.session_processed = False
-            else:
-                self.session_processed = True
+            self.session_processed = False
         else:
             self.log("Revert failed or no valid backup available.")
+        self.flush_log()
 
     # When closing, if changes were made, prompt the user with a custom dialog that offers:
     # 1. Restart Services (left button)
     # 2. Reboot (middle button)
     # 3. Do Nothing (right button)
     def closeEvent(self, event: QtGui.QCloseEvent) -> None:
+        # Let a running modify/revert finish before the session flag is checked.
+        QtCore.QThreadPool.globalInstance().waitForDone()
+        QtCore.QCoreApplication.processEvents()
         if self.session_processed:
             dialog = CloseActionDialog(self)
             result = dialog.exec()
             if result == 1:
                 restart_services(self.log)
             elif result == 2:
-                os.system("shutdown /r /t 0")
+                import subprocess
+                # Start shutdown.exe directly and detached, without an intermediate cmd.exe or console window,
+                # so the window can close without waiting on it.
+                subprocess.Popen(["shutdown", "/r", "/t", "0"], creationflags=subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP, close_fds=True)
         event.accept()
 
 def main():
     app = QtWidgets.QApplication(sys.argv)
+    app.setStyleSheet(DARK_THEME_STYLESHEET)
     window = DLSSOverrideApp()
     window.show()
     sys.exit(app.exec())